@@ -6,16 +6,17 @@ Supports The New Atlantis (specialized extraction) and generic sites (LLM-based
 
 import argparse
 import json
+import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
+from html import unescape
 from typing import Optional
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from markdownify import markdownify
 from pydantic import BaseModel, Field
 
 # Optional llm import - gracefully handle if not installed
@@ -24,6 +25,62 @@ try:
 except ImportError:
     llm = None
 
+# Optional orjson import - faster JSON-LD parsing, falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared HTTP session, created on first use by _get_session()
+_SESSION = None
+_CACHE_NAME = "article-assistant"
+_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+# Set to 1 to serve fetches only from the HTTP cache, never the network
+_OFFLINE_ENV = "ARTICLE_ASSISTANT_OFFLINE"
+# (connect, read) timeouts in seconds: fail fast on dead hosts, wait on slow pages
+_TIMEOUT = (5, 30)
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# Article pages are read in chunks and capped to bound memory use
+_CHUNK_SIZE = 64 * 1024
+_MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+# Minimum number of New Atlantis pages before parsing moves to worker processes
+_PARALLEL_PARSE_MIN = 8
+
+# Precompiled patterns used by NewAtlantisExtractor.extract_metadata
+_BYLINE_CLASS_RE = re.compile(r"author|byline", re.I)
+_BY_PREFIX_RE = re.compile(r"^(by|author:?)\s*", re.I)
+_JSONLD_RE = re.compile(
+    # Minifiers may leave the type attribute unquoted
+    r"<script[^>]+type=[\"']?application/ld\+json[\"']?(?=[\s>])[^>]*>"
+    r"(.*?)</script>",
+    re.I | re.S,
+)
+# Markup dropped before the issue scan: script/style blocks, comments,
+# declarations/processing instructions and tags (quoted attribute values
+# may contain ">"). Only "<" followed by a tag name starts a tag, so a bare
+# "<" in text is left alone.
+_MARKUP_RE = re.compile(
+    r"<(script|style)\b.*?</\1\s*>"
+    r"|<!--.*?-->"
+    r"|<[!?][^>]*>"
+    r"|</?[A-Za-z][^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>",
+    re.I | re.S,
+)
+# Explicit issue number, or a season and year in either order
+_COMBINED_ISSUE_RE = re.compile(
+    r"No\.\s*(?P<number>\d+)\s*\((?P<issue>[^)]+)\)"
+    r"|(?i:(?P<s1>Winter|Spring|Summer|Fall|Autumn)\s+(?P<y1>\d{4}))"
+    r"|(?i:(?P<y2>\d{4})\s+(?P<s2>Winter|Spring|Summer|Fall|Autumn))"
+)
+
+# Runs of blank lines left in markdownify output by stripped elements
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Season offsets within a year (Winter = 0, Spring = 1, Summer = 2, Fall = 3)
+_SEASON_OFFSET = {"winter": 0, "spring": 1, "summer": 2, "fall": 3, "autumn": 3}
+
 
 class ArticleMetadata(BaseModel):
     """Pydantic schema for article metadata extraction with structured output."""
@@ -93,21 +150,211 @@ class MetadataExtractor(ABC):
         pass
 
 
-def fetch_article_content(url):
-    """Fetch the HTML content of the article."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
+def _new_session(use_cache=True):
+    """
+    Create an HTTP session with pooled keep-alive connections.
+
+    When use_cache is True and the optional requests-cache package is
+    installed, the session is an on-disk cached session that honours
+    Cache-Control and revalidates with ETag/Last-Modified, so repeat runs
+    against the same URL are cheap. requests is imported here rather than
+    at module level so that paths which never fetch (--help, library use
+    of the formatting helpers) do not pay its import cost.
+
+    When ARTICLE_ASSISTANT_OFFLINE=1 the session only answers from the
+    cache, whatever use_cache says. Entries past their expiry are still
+    served, since they cannot be revalidated; a page that was never
+    fetched comes back as a 504 error instead of touching the network.
+
+    Raises:
+        RuntimeError: If offline mode is requested without requests-cache.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    offline = os.environ.get(_OFFLINE_ENV) == "1"
+    session = None
+    if use_cache or offline:
+        try:
+            import requests_cache
+        except ImportError:
+            if offline:
+                raise RuntimeError(
+                    f"{_OFFLINE_ENV}=1 requires the requests-cache package "
+                    "(uv sync --extra cache)"
+                )
+        else:
+            # Stored in the user cache directory as article-assistant.sqlite
+            session = requests_cache.CachedSession(
+                _CACHE_NAME,
+                use_cache_dir=True,
+                expire_after=_CACHE_EXPIRE_SECONDS,
+                cache_control=True,
+                only_if_cached=offline,
+                stale_if_error=offline,
+                filter_fn=_read_before_caching,
+            )
+    if session is None:
+        session = requests.Session()
+    session.headers.update({"User-Agent": _USER_AGENT})
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _new_session()
+    return _SESSION
 
+
+def _read_body(response):
+    """
+    Read a streamed response body in chunks, enforcing the size cap.
+
+    Raises:
+        requests.RequestException: If the body exceeds _MAX_RESPONSE_BYTES.
+    """
+    import requests
+
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(_CHUNK_SIZE):
+        total += len(chunk)
+        if total > _MAX_RESPONSE_BYTES:
+            limit_mb = _MAX_RESPONSE_BYTES // (1024 * 1024)
+            raise requests.RequestException(f"Response exceeds {limit_mb} MB limit")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _read_before_caching(response):
+    """
+    requests-cache filter that reads the body under the size cap first.
+
+    requests-cache stores a response by reading all of response.content,
+    which would bypass the cap. Reading it here instead means an oversized
+    page raises before anything is held in memory or written to the cache.
+    The body is kept on the response, so the later read in _download
+    reuses it rather than touching the network again.
+    """
+    # Only 200 responses are cached; leave other bodies to _download
+    if response.status_code != 200:
+        return False
     try:
-        response = requests.get(url, headers=headers)
+        response._content = _read_body(response)
+    except Exception:
+        response.close()
+        raise
+    return True
+
+
+def _download(url, session):
+    """
+    Download one page body as text.
+
+    Raises:
+        requests.RequestException: If the request fails, the server returns
+            an error status, or the body exceeds the size cap.
+    """
+    # Closing a streamed response returns its connection to the pool,
+    # including when the status check or the size cap fails
+    with closing(session.get(url, timeout=_TIMEOUT, stream=True)) as response:
         response.raise_for_status()
-        return response.text
+        # Read the body in chunks so an oversized page cannot exhaust memory
+        body = _read_body(response)
+
+    try:
+        return body.decode(response.encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        # Unknown charsets (e.g. "utf8mb4") fall back as requests does
+        return body.decode("utf-8", errors="replace")
+
+
+def fetch_article_content(url, session=None):
+    """
+    Fetch the HTML content of the article.
+
+    Args:
+        url: URL of the article
+        session: Optional requests.Session to reuse across many fetches
+            (default: the shared module-level session)
+
+    Returns:
+        The response body as text.
+    """
+    import requests
+
+    try:
+        return _download(url, session or _get_session())
     except requests.RequestException as e:
         print(f"Error fetching article: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def fetch_many(urls, max_workers=8, session=None, return_exceptions=False):
+    """
+    Fetch several articles concurrently.
+
+    Network latency dominates fetching, so the requests run on a thread
+    pool and share one session (and its connection pool).
+
+    Args:
+        urls: Iterable of article URLs
+        max_workers: Maximum number of concurrent fetches (default: 8)
+        session: Optional requests.Session (default: the shared module-level session)
+        return_exceptions: If True, a failed fetch yields its
+            requests.RequestException in place of the HTML instead of
+            exiting, so the other pages can still be used
+
+    Returns:
+        List of HTML strings (or exceptions) in the same order as ``urls``.
+    """
+    import requests
+
+    # Resolve the shared session up front so worker threads cannot race to create it
+    session = session or _get_session()
+
+    def fetch(url):
+        if not return_exceptions:
+            return fetch_article_content(url, session)
+        try:
+            return _download(url, session)
+        except requests.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fetch, urls))
+
+
+def _loads_json(text):
+    """Parse JSON with orjson when installed, otherwise the standard library."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _normalize_whitespace(text):
+    """Collapse runs of whitespace to single spaces and trim the ends."""
+    return " ".join(text.split())
+
+
+def _is_content_noise(tag):
+    """Return True for New Atlantis body elements that are not article text."""
+    if tag.name in ("script", "style", "nav", "aside"):
+        return True
+    if tag.name != "div":
+        return False
+    # Tooltip/paywall prompts and promotional "Keep reading" epigraph blocks
+    return any(
+        css_class == "tooltip-container" or "wp-block-lazyblock-epigraph" in css_class
+        for css_class in tag.get("class", ())
+    )
+
+
 def infer_edition_number(season, year):
     """
     Infer The New Atlantis edition number from season and year.
@@ -125,6 +372,18 @@ def infer_edition_number(season, year):
         return None
 
     season_lower = season.lower()
+    number = _EDITION_TABLE.get((season_lower, year))
+    if number is None:
+        # Outside the precomputed range, or an unknown season
+        number = _compute_edition_number(season_lower, year)
+    return number
+
+
+def _compute_edition_number(season_lower, year):
+    """Compute the edition number for a lowercase season name and integer year."""
+    offset = _SEASON_OFFSET.get(season_lower)
+    if offset is None:
+        return None
 
     # Base calculation: Winter 2025 = 79
     # Each year has 4 issues, so year difference * 4
@@ -135,14 +394,15 @@ def infer_edition_number(season, year):
     year_diff = year - base_year
     year_base_number = base_winter_number + (year_diff * 4)
 
-    # Season offsets within a year (Winter = 0, Spring = 1, Summer = 2, Fall = 3)
-    season_offset = {"winter": 0, "spring": 1, "summer": 2, "fall": 3, "autumn": 3}
+    return year_base_number + offset
 
-    offset = season_offset.get(season_lower)
-    if offset is None:
-        return None
 
-    return year_base_number + offset
+# Edition numbers for every season of 2000-2099, computed once at import
+_EDITION_TABLE = {
+    (season, year): _compute_edition_number(season, year)
+    for year in range(2000, 2100)
+    for season in _SEASON_OFFSET
+}
 
 
 class NewAtlantisExtractor(MetadataExtractor):
@@ -165,14 +425,13 @@ class NewAtlantisExtractor(MetadataExtractor):
         This is the existing extract_metadata() function logic,
         moved into the class.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
         metadata = {}
 
-        # Try to extract from JSON-LD structured data first
-        json_ld_scripts = soup.find_all("script", type="application/ld+json")
-        for script in json_ld_scripts:
+        # Try to extract from JSON-LD structured data first. The script blocks
+        # are located with a regex so the common path never builds a DOM.
+        for script in _JSONLD_RE.finditer(html_content):
             try:
-                data = json.loads(script.string)
+                data = _loads_json(script.group(1))
                 if isinstance(data, dict) and data.get("@type") == "Article":
                     metadata["title"] = data.get("headline", "").strip()
 
@@ -182,7 +441,7 @@ class NewAtlantisExtractor(MetadataExtractor):
                         authors = [authors]
                     if authors:
                         metadata["authors"] = [
-                            re.sub(r"\s+", " ", author.get("name", "").strip())
+                            _normalize_whitespace(author.get("name", ""))
                             for author in authors
                             if author.get("name")
                         ]
@@ -193,60 +452,86 @@ class NewAtlantisExtractor(MetadataExtractor):
                         metadata["date_published"] = date_published
 
                     break
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             except (json.JSONDecodeError, KeyError):
                 continue
 
-        # Fallback to HTML parsing if JSON-LD doesn't work
-        if not metadata.get("title"):
-            title_tag = soup.find("h1") or soup.find("title")
-            if title_tag:
-                metadata["title"] = title_tag.get_text().strip()
+        # Fallback to HTML parsing only for fields JSON-LD did not supply
+        need_title = not metadata.get("title")
+        need_authors = not metadata.get("authors")
+        if need_title or need_authors:
+            from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+            # When only one field is missing, build just the elements that
+            # can supply it; a page missing both gets a full parse
+            if need_title and need_authors:
+                parse_only = None
+            elif need_title:
+                parse_only = SoupStrainer(["h1", "title"])
+            else:
+                parse_only = SoupStrainer(class_=_BYLINE_CLASS_RE)
+            soup = BeautifulSoup(html_content, "lxml", parse_only=parse_only)
+
+            # Collect the first h1, title and byline element in a single walk
+            h1_tag = title_tag = byline = None
+            for element in soup.descendants:
+                if not isinstance(element, Tag):
+                    continue
+                if element.name == "h1" and h1_tag is None:
+                    h1_tag = element
+                elif element.name == "title" and title_tag is None:
+                    title_tag = element
+                if byline is None and any(
+                    _BYLINE_CLASS_RE.search(css_class)
+                    for css_class in element.get("class", ())
+                ):
+                    byline = element
+                if (h1_tag or not need_title) and (byline or not need_authors):
+                    break
+
+            if need_title:
+                title_tag = h1_tag or title_tag
+                if title_tag:
+                    metadata["title"] = title_tag.get_text().strip()
 
-        # Extract author from byline if not found in JSON-LD
-        if not metadata.get("authors"):
-            byline = soup.find(class_=re.compile(r"author|byline", re.I))
-            if byline:
+            # Extract author from byline if not found in JSON-LD
+            if need_authors and byline:
                 author_text = byline.get_text().strip()
                 # Clean up common prefixes
-                author_text = re.sub(r"^(by|author:?)\s*", "", author_text, flags=re.I)
+                author_text = _BY_PREFIX_RE.sub("", author_text)
                 # Normalize whitespace
-                author_text = re.sub(r"\s+", " ", author_text)
+                author_text = _normalize_whitespace(author_text)
                 metadata["authors"] = [author_text]
 
-        # Extract issue information
-        issue_info = soup.find(string=re.compile(r"No\.\s*\d+"))
-        if issue_info:
-            issue_match = re.search(r"No\.\s*(\d+)\s*\(([^)]+)\)", issue_info)
-            if issue_match:
-                metadata["issue_number"] = issue_match.group(1)
-                metadata["issue_season"] = issue_match.group(2)
-
-        # If no explicit issue number found, look for season-only patterns
-        if not metadata.get("issue_number"):
-            # Look for patterns like "Winter 2025", "Spring 2024", etc.
-            season_patterns = [
-                r"(Winter|Spring|Summer|Fall|Autumn)\s+(\d{4})",
-                r"(\d{4})\s+(Winter|Spring|Summer|Fall|Autumn)",
-            ]
-
-            for pattern in season_patterns:
-                season_match = soup.find(string=re.compile(pattern, re.IGNORECASE))
-                if season_match:
-                    match = re.search(pattern, season_match, re.IGNORECASE)
-                    if match:
-                        if match.group(1).isdigit():
-                            # Pattern: "2025 Winter"
-                            year, season = match.group(1), match.group(2)
-                        else:
-                            # Pattern: "Winter 2025"
-                            season, year = match.group(1), match.group(2)
-
-                        # Infer the issue number
-                        inferred_number = infer_edition_number(season, int(year))
-                        if inferred_number:
-                            metadata["issue_number"] = str(inferred_number)
-                            metadata["issue_season"] = f"{season} {year}"
-                        break
+        # Extract issue information with a single scan of the page text, so
+        # attribute values and markup never match and entities such as
+        # &nbsp; count as whitespace. An explicit "No. 79 (Winter 2025)"
+        # takes precedence over a bare season; otherwise the first
+        # "Winter 2025"/"2025 Winter" is used.
+        page_text = unescape(_MARKUP_RE.sub("", html_content))
+        has_issue_token = "No." in page_text
+        season_match = None
+        for match in _COMBINED_ISSUE_RE.finditer(page_text):
+            if match["number"]:
+                metadata["issue_number"] = match["number"]
+                metadata["issue_season"] = _normalize_whitespace(match["issue"])
+                break
+            if season_match is None:
+                season_match = match
+                # Without a "No." token nothing later can outrank this match
+                if not has_issue_token:
+                    break
+
+        if not metadata.get("issue_number") and season_match:
+            # "Winter 2025" fills s1/y1, "2025 Winter" fills s2/y2
+            season = season_match["s1"] or season_match["s2"]
+            year = season_match["y1"] or season_match["y2"]
+
+            # Infer the issue number
+            inferred_number = infer_edition_number(season, int(year))
+            if inferred_number:
+                metadata["issue_number"] = str(inferred_number)
+                metadata["issue_season"] = f"{season} {year}"
 
         # Set publication name
         metadata["publication"] = "The New Atlantis"
@@ -257,33 +542,41 @@ class NewAtlantisExtractor(MetadataExtractor):
         self, html_content: str, url: str, include_images: bool = True
     ) -> str:
         """Extract article body as Markdown using site-specific selectors."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        from bs4 import BeautifulSoup, Tag
+        from markdownify import markdownify
+
+        soup = BeautifulSoup(html_content, "lxml")
 
+        # Collect the body candidates in a single walk, stopping at the
+        # content div since it outranks article, main and body
+        candidates = {}
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            if element.name == "div" and "gutenberg-content" in element.get(
+                "class", ()
+            ):
+                candidates["div"] = element
+                break
+            if element.name in ("article", "main", "body"):
+                candidates.setdefault(element.name, element)
         body = (
-            soup.find("div", class_="gutenberg-content")
-            or soup.find("article")
-            or soup.find("main")
-            or soup.find("body")
+            candidates.get("div")
+            or candidates.get("article")
+            or candidates.get("main")
+            or candidates.get("body")
         )
 
         if not body or not body.get_text(strip=True):
             raise ValueError("Could not locate article body")
 
-        # Strip noise elements within the body
-        for tag in body.find_all(["script", "style", "nav", "aside"]):
-            tag.decompose()
-        # Strip tooltip/paywall prompts
-        for tag in body.find_all("div", class_="tooltip-container"):
-            tag.decompose()
-        # Strip promotional "Keep reading" epigraph blocks at end
-        for tag in body.find_all(
-            "div", class_=lambda c: c and "wp-block-lazyblock-epigraph" in c
-        ):
+        # Strip noise elements within the body in one pass
+        for tag in body.find_all(_is_content_noise):
             tag.decompose()
 
         strip_tags = ["img"] if not include_images else []
         md = markdownify(str(body), heading_style="ATX", strip=strip_tags)
-        md = re.sub(r"\n{3,}", "\n\n", md)
+        md = _BLANK_LINES_RE.sub("\n\n", md)
         return md.strip()
 
 
@@ -337,8 +630,10 @@ class LLMExtractor(MetadataExtractor):
         Returns:
             Dictionary with extracted metadata
         """
+        from bs4 import BeautifulSoup
+
         # Convert HTML to text
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
 
         # Remove script and style tags
         for tag in soup(["script", "style", "nav", "footer", "header"]):
@@ -386,10 +681,9 @@ Be accurate and only extract information that is clearly present."""
         except Exception as e:
             print(f"Error during LLM extraction: {e}", file=sys.stderr)
             # Return minimal metadata on failure
+            title_tag = soup.find("title")
             return {
-                "title": soup.find("title").get_text()
-                if soup.find("title")
-                else "Unknown Title",
+                "title": title_tag.get_text() if title_tag else "Unknown Title",
                 "authors": [],
                 "publication": urlparse(url).netloc,
             }
@@ -398,7 +692,10 @@ Be accurate and only extract information that is clearly present."""
         self, html_content: str, url: str, include_images: bool = True
     ) -> str:
         """Extract article body as Markdown using markdownify with LLM fallback."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        from bs4 import BeautifulSoup
+        from markdownify import markdownify
+
+        soup = BeautifulSoup(html_content, "lxml")
 
         # Find article body element
         body = soup.find("article") or soup.find("main") or soup.find("body")
@@ -412,13 +709,13 @@ Be accurate and only extract information that is clearly present."""
 
             strip_tags = ["img"] if not include_images else []
             md_result = markdownify(str(body), heading_style="ATX", strip=strip_tags)
-            md_result = re.sub(r"\n{3,}", "\n\n", md_result).strip()
+            md_result = _BLANK_LINES_RE.sub("\n\n", md_result).strip()
 
             if len(md_result) > 200:
                 return md_result
 
-        # Fallback to LLM for thin or missing markdownify results
-        soup = BeautifulSoup(html_content, "html.parser")
+        # Fallback to LLM for thin or missing markdownify results, reusing the
+        # tree parsed above; noise already removed from the body is skipped
         for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
             tag.decompose()
 
@@ -494,75 +791,156 @@ def extract_metadata(html_content):
     return extractor.extract_metadata(html_content, "")
 
 
+def extract_many(html_contents, urls, max_workers=None):
+    """
+    Extract New Atlantis metadata from several pages in parallel.
+
+    HTML parsing is CPU-bound, so the pages are spread over a process
+    pool (sidestepping the GIL) in chunks to amortize pickling overhead.
+
+    Args:
+        html_contents: HTML strings of the fetched articles
+        urls: The matching article URLs
+        max_workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        List of metadata dictionaries in the same order as the input.
+    """
+    extractor = NewAtlantisExtractor()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(extractor.extract_metadata, html_contents, urls, chunksize=4)
+        )
+
+
 def format_markdown_header(metadata, creation_date=None):
     """Format the extracted metadata into the required Markdown header."""
     if creation_date is None:
         creation_date = datetime.now().strftime("%Y-%m-%d")
 
-    title = metadata.get("title", "Unknown Title")
-    authors = metadata.get("authors", ["Unknown Author"])
+    # Empty values (e.g. an LLM that found no authors) get the defaults too
+    title = metadata.get("title") or "Unknown Title"
+    authors = metadata.get("authors") or ["Unknown Author"]
     publication = metadata.get("publication", "The New Atlantis")
 
-    # Format periodical edition
-    periodical_edition = ""
+    # Each optional line carries its own leading newline so empty parts vanish
+    author_lines = "".join(f"\n  - {author}" for author in authors)
+    edition_line = ""
     if metadata.get("issue_number") and metadata.get("issue_season"):
-        periodical_edition = (
-            f"No. {metadata['issue_number']} ({metadata['issue_season']})"
+        edition_line = (
+            f"\nperiodical-edition: No. {metadata['issue_number']}"
+            f" ({metadata['issue_season']})"
         )
 
     # Build the YAML front matter
-    yaml_lines = ["---", f"title: {title}", "author:"]
-
-    for author in authors:
-        yaml_lines.append(f"  - {author}")
-
-    yaml_lines.extend(
-        [
-            "format: journal article",
-            f"creation-date: {creation_date}",
-            f"publication: {publication}",
-        ]
+    return (
+        f"---\ntitle: {title}\nauthor:{author_lines}\n"
+        f"format: journal article\ncreation-date: {creation_date}\n"
+        f"publication: {publication}{edition_line}\n---\n\n## Notes"
     )
 
-    if periodical_edition:
-        yaml_lines.append(f"periodical-edition: {periodical_edition}")
-
-    yaml_lines.extend(["---", "", "## Notes"])
-
-    return "\n".join(yaml_lines)
-
 
-def _run_metadata(args):
-    """Handle the metadata subcommand."""
-    html_content = fetch_article_content(args.url)
+def _read_batch_urls(path):
+    """
+    Read article URLs for --batch, one per line ("-" reads stdin).
 
-    try:
-        extractor = get_extractor_for_url(args.url, model_name=args.model)
-    except ImportError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        print("\nFor generic site extraction, install: uv add llm", file=sys.stderr)
+    Blank lines and lines starting with "#" are ignored.
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    stripped = (line.strip() for line in lines)
+    return [line for line in stripped if line and not line.startswith("#")]
+
+
+def _cli_session(args):
+    """Return the HTTP session for a CLI run, exiting on configuration errors."""
+    if args.no_cache and os.environ.get(_OFFLINE_ENV) == "1":
+        print(
+            f"Error: --no-cache cannot be used with {_OFFLINE_ENV}=1",
+            file=sys.stderr,
+        )
         sys.exit(1)
+    try:
+        if args.no_cache:
+            return _new_session(use_cache=False)
+        return _get_session()
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    metadata = extractor.extract_metadata(html_content, args.url)
 
-    extractor_name = extractor.__class__.__name__
-    if extractor_name != "NewAtlantisExtractor":
-        print(f"# Using {extractor_name} with model: {args.model}", file=sys.stderr)
+def _print_metadata(url, html_content, args, metadata=None):
+    """
+    Print the Markdown header for one fetched article.
 
-    parsed_url = urlparse(args.url)
-    if "thenewatlantis.com" not in parsed_url.netloc:
-        print("Info: Using LLM-based extraction for this site", file=sys.stderr)
+    Metadata is extracted here unless it was already produced by
+    extract_many().
+    """
+    if metadata is None:
+        try:
+            extractor = get_extractor_for_url(url, model_name=args.model)
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            print("\nFor generic site extraction, install: uv add llm", file=sys.stderr)
+            sys.exit(1)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        metadata = extractor.extract_metadata(html_content, url)
+
+        extractor_name = extractor.__class__.__name__
+        if extractor_name != "NewAtlantisExtractor":
+            print(f"# Using {extractor_name} with model: {args.model}", file=sys.stderr)
+
+        parsed_url = urlparse(url)
+        if "thenewatlantis.com" not in parsed_url.netloc:
+            print("Info: Using LLM-based extraction for this site", file=sys.stderr)
 
     markdown_header = format_markdown_header(metadata, args.creation_date)
     print(markdown_header)
 
 
+def _run_metadata(args):
+    """Handle the metadata subcommand."""
+    results = fetch_many(args.urls, session=_cli_session(args), return_exceptions=True)
+
+    # A failed page is reported and skipped so the rest of a batch still prints
+    pages = []
+    for url, result in zip(args.urls, results):
+        if isinstance(result, Exception):
+            print(f"Error fetching article: {url}: {result}", file=sys.stderr)
+        else:
+            pages.append((url, result))
+
+    # Parsing New Atlantis pages is CPU-bound, so large batches are spread
+    # over worker processes; LLM extraction stays in this process
+    extracted = {}
+    new_atlantis = NewAtlantisExtractor()
+    indexes = [i for i, (url, _) in enumerate(pages) if new_atlantis.supports_url(url)]
+    if len(indexes) >= _PARALLEL_PARSE_MIN:
+        results = extract_many(
+            [pages[i][1] for i in indexes], [pages[i][0] for i in indexes]
+        )
+        extracted = dict(zip(indexes, results))
+
+    for index, (url, html_content) in enumerate(pages):
+        if index:
+            # Blank line between consecutive headers
+            print()
+        _print_metadata(url, html_content, args, extracted.get(index))
+
+    if len(pages) < len(args.urls):
+        sys.exit(1)
+
+
 def _run_content(args):
     """Handle the content subcommand."""
-    html_content = fetch_article_content(args.url)
+    html_content = fetch_article_content(args.url, _cli_session(args))
 
     try:
         extractor = get_extractor_for_url(args.url, model_name=args.model)
@@ -594,7 +972,15 @@ def main():
         "metadata",
         help="Extract article metadata as YAML front matter",
     )
-    metadata_parser.add_argument("url", help="URL of the article")
+    metadata_parser.add_argument(
+        "urls", nargs="*", metavar="url", help="URL(s) of the article(s)"
+    )
+    metadata_parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help="Read additional URLs from FILE, one per line ('-' reads stdin)",
+    )
     metadata_parser.add_argument(
         "--creation-date",
         help="Override creation date (YYYY-MM-DD format)",
@@ -606,6 +992,12 @@ def main():
         help="LLM model for generic extraction (default: gpt-4o-mini). "
         "Only used for non-specialized sites.",
     )
+    metadata_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Always download the page, bypassing the HTTP cache",
+    )
     # content subcommand
     content_parser = subparsers.add_parser(
         "content",
@@ -618,6 +1010,12 @@ def main():
         help="LLM model for generic extraction (default: gpt-4o-mini). "
         "Only used for non-specialized sites.",
     )
+    content_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Always download the page, bypassing the HTTP cache",
+    )
     content_parser.add_argument(
         "--no-images",
         action="store_true",
@@ -627,6 +1025,13 @@ def main():
     args = parser.parse_args()
 
     if args.command == "metadata":
+        if args.batch:
+            try:
+                args.urls.extend(_read_batch_urls(args.batch))
+            except OSError as e:
+                parser.error(f"cannot read batch file: {e}")
+        if not args.urls:
+            parser.error("metadata requires at least one URL or --batch FILE")
         _run_metadata(args)
     elif args.command == "content":
         _run_content(args)
@@ -0,0 +1,86 @@
+"""
+Shared fixtures for the article_assistant tests.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """
+    Serve canned HTML from the shared HTTP session.
+
+    Returns a factory that takes the pages to serve and returns the mock
+    session, so tests can inspect the requests that were made. Pages may
+    be given as:
+
+    - a string, returned for every URL;
+    - a ``{url: html}`` mapping;
+    - a callable taking the URL and returning its HTML.
+
+    A mapping value or callable result that is an exception instance is
+    raised from ``raise_for_status()`` for that URL instead.
+    """
+    session = Mock()
+    monkeypatch.setattr("article_assistant._SESSION", session)
+
+    def _respond(response, page):
+        if isinstance(page, Exception):
+            response.raise_for_status.side_effect = page
+        else:
+            response.iter_content.return_value = [page.encode()]
+        response.encoding = "utf-8"
+        return response
+
+    def _factory(pages):
+        if isinstance(pages, str):
+            _respond(session.get.return_value, pages)
+            return session
+
+        lookup = pages if callable(pages) else pages.__getitem__
+        session.get.side_effect = lambda url, **kwargs: _respond(Mock(), lookup(url))
+        return session
+
+    return _factory
+
+
+@pytest.fixture
+def local_server():
+    """
+    Serve canned pages from a real HTTP server on localhost.
+
+    Returns a function that takes a ``{path: body_bytes}`` mapping and
+    returns the server's base URL. Unknown paths get a 404.
+    """
+    servers = []
+
+    def _serve(pages):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield _serve
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
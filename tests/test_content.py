@@ -75,6 +75,23 @@ class TestNewAtlantisExtractorContent:
         assert "Article body paragraph." in result
         assert "Nav" not in result
 
+    def test_extract_content_prefers_gutenberg_div_over_earlier_article(self):
+        """Test that div.gutenberg-content wins even after an <article>."""
+        extractor = NewAtlantisExtractor()
+        html = """
+        <html><body>
+            <article><p>Related teaser.</p></article>
+            <div class="gutenberg-content">
+                <p>Real article text.</p>
+                <aside>Pull quote <script>track()</script></aside>
+            </div>
+        </body></html>
+        """
+
+        result = extractor.extract_content(html, "https://thenewatlantis.com/test")
+
+        assert result == "Real article text."
+
     def test_extract_content_includes_images_by_default(self):
         """Test that images are included as Markdown by default."""
         extractor = NewAtlantisExtractor()
@@ -114,6 +131,22 @@ class TestNewAtlantisExtractorContent:
         assert "Before image." in result
         assert "After image." in result
 
+    def test_extract_content_collapses_blank_lines(self):
+        """Test that stripped noise does not leave runs of blank lines."""
+        extractor = NewAtlantisExtractor()
+        html = """
+        <div class="gutenberg-content">
+            <p>First paragraph.</p>
+            <div class="tooltip-container">Sign in</div>
+            <aside>Aside</aside>
+            <p>Second paragraph.</p>
+        </div>
+        """
+
+        result = extractor.extract_content(html, "https://thenewatlantis.com/test")
+
+        assert result == "First paragraph.\n\nSecond paragraph."
+
     def test_extract_content_raises_when_no_body_found(self):
         """Test that ValueError is raised when no article body element exists."""
         extractor = NewAtlantisExtractor()
@@ -122,6 +155,23 @@ class TestNewAtlantisExtractorContent:
         with pytest.raises(ValueError, match="Could not locate article body"):
             extractor.extract_content(html, "https://thenewatlantis.com/test")
 
+    def test_extract_content_tolerates_malformed_html(self):
+        """Test that unclosed and stray tags do not lose article text."""
+        extractor = NewAtlantisExtractor()
+        html = """
+        <div class="gutenberg-content">
+            <p>First paragraph
+            <p>Second paragraph with <em>unclosed emphasis
+        </div></span>
+        <p>Outside the article body.</p>
+        """
+
+        result = extractor.extract_content(html, "https://thenewatlantis.com/test")
+
+        assert "First paragraph" in result
+        assert "Second paragraph" in result
+        assert "Outside the article body" not in result
+
 
 class TestLLMExtractorContent:
     """Test cases for LLMExtractor.extract_content."""
@@ -174,6 +224,31 @@ class TestLLMExtractorContent:
         assert result == "# Article\n\nRich LLM-rendered content."
         mock_model.prompt.assert_called_once()
 
+    @patch("article_assistant.llm")
+    def test_extract_content_llm_fallback_reuses_parsed_tree(self, mock_llm):
+        """Test that the LLM fallback does not parse the HTML a second time."""
+        from bs4 import BeautifulSoup
+
+        mock_response = Mock()
+        mock_response.text.return_value = "Rendered."
+        mock_llm.get_model.return_value.prompt.return_value = mock_response
+
+        extractor = LLMExtractor()
+
+        html = """
+        <html><head><script>var tracking = 1;</script></head>
+        <body><article><p>Short.</p><aside>Related</aside></article></body></html>
+        """
+
+        with patch("bs4.BeautifulSoup", wraps=BeautifulSoup) as mock_soup:
+            extractor.extract_content(html, "https://example.com/article")
+
+        assert mock_soup.call_count == 1
+        prompt = mock_llm.get_model.return_value.prompt.call_args[0][0]
+        assert "Short." in prompt
+        assert "tracking" not in prompt
+        assert "Related" not in prompt
+
     @patch("article_assistant.llm")
     def test_extract_content_returns_thin_markdownify_on_llm_error(self, mock_llm):
         """Test that thin markdownify result is returned if LLM also fails."""
@@ -207,12 +282,11 @@ class TestLLMExtractorContent:
 class TestContentSubcommand:
     """Functional tests for the content subcommand."""
 
-    @patch("article_assistant.requests.get")
     @patch(
         "sys.argv",
         ["script.py", "content", "https://www.thenewatlantis.com/test"],
     )
-    def test_content_subcommand_outputs_markdown(self, mock_get, capsys):
+    def test_content_subcommand_outputs_markdown(self, mock_http, capsys):
         """Test that the content subcommand outputs article body as Markdown."""
         mock_html = """
         <html><body>
@@ -226,10 +300,7 @@ class TestContentSubcommand:
             </div>
         </body></html>
         """
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_http(mock_html)
 
         main()
 
@@ -242,7 +313,6 @@ class TestContentSubcommand:
         assert "## Notes" not in captured.out
         assert "title:" not in captured.out
 
-    @patch("article_assistant.requests.get")
     @patch(
         "sys.argv",
         [
@@ -252,7 +322,7 @@ class TestContentSubcommand:
             "https://www.thenewatlantis.com/test",
         ],
     )
-    def test_content_subcommand_no_images_flag(self, mock_get, capsys):
+    def test_content_subcommand_no_images_flag(self, mock_http, capsys):
         """Test that --no-images strips images from output."""
         mock_html = """
         <html><body>
@@ -266,10 +336,7 @@ class TestContentSubcommand:
             </div>
         </body></html>
         """
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_http(mock_html)
 
         main()
 
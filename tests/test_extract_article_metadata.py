@@ -3,23 +3,27 @@
 Unit tests for article_assistant.py
 """
 
+import sys
+
 import pytest
 from unittest.mock import patch, Mock
 
 from article_assistant import (
+    _get_session,
+    _new_session,
+    _read_before_caching,
     extract_metadata,
     format_markdown_header,
     fetch_article_content,
+    fetch_many,
     infer_edition_number,
 )
 
 
-class TestExtractMetadata:
-    """Test cases for the extract_metadata function."""
-
-    def test_extract_metadata_from_json_ld(self):
-        """Test extracting metadata from JSON-LD structured data."""
-        html_content = """
+# (html, expected metadata subset) cases for extract_metadata
+HTML_CASES = [
+    pytest.param(
+        """
         <html>
         <head>
             <script type="application/ld+json">
@@ -33,18 +37,17 @@ class TestExtractMetadata:
         </head>
         <body></body>
         </html>
+        """,
+        {
+            "title": "The Tyranny of Now",
+            "authors": ["Nicholas Carr"],  # Whitespace normalized
+            "date_published": "2025-01-15",
+            "publication": "The New Atlantis",
+        },
+        id="json_ld",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["title"] == "The Tyranny of Now"
-        assert metadata["authors"] == ["Nicholas Carr"]  # Whitespace normalized
-        assert metadata["date_published"] == "2025-01-15"
-        assert metadata["publication"] == "The New Atlantis"
-
-    def test_extract_metadata_single_author_dict(self):
-        """Test extracting metadata when author is a single dict, not list."""
-        html_content = """
         <html>
         <head>
             <script type="application/ld+json">
@@ -58,16 +61,12 @@ class TestExtractMetadata:
         </head>
         <body></body>
         </html>
+        """,
+        {"title": "Test Article", "authors": ["John Doe"]},
+        id="single_author_dict",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["title"] == "Test Article"
-        assert metadata["authors"] == ["John Doe"]
-
-    def test_extract_metadata_fallback_to_html(self):
-        """Test fallback to HTML parsing when JSON-LD is not available."""
-        html_content = """
         <html>
         <head><title>HTML Title</title></head>
         <body>
@@ -75,63 +74,52 @@ class TestExtractMetadata:
             <div class="author-byline">By Jane Smith</div>
         </body>
         </html>
+        """,
+        {
+            "title": "Article Title from H1",
+            "authors": ["Jane Smith"],
+            "publication": "The New Atlantis",
+        },
+        id="fallback_to_html",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["title"] == "Article Title from H1"
-        assert metadata["authors"] == ["Jane Smith"]
-        assert metadata["publication"] == "The New Atlantis"
-
-    def test_extract_metadata_title_fallback_to_title_tag(self):
-        """Test title extraction falls back to title tag when no h1."""
-        html_content = """
         <html>
         <head><title>Title from Tag</title></head>
         <body>
             <div class="author">By Author Name</div>
         </body>
         </html>
+        """,
+        {"title": "Title from Tag"},
+        id="title_fallback_to_title_tag",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["title"] == "Title from Tag"
-
-    def test_extract_metadata_author_prefix_cleanup(self):
-        """Test that author prefixes are cleaned up properly."""
-        html_content = """
         <html>
         <body>
             <h1>Test Article</h1>
             <div class="byline">Author: John Doe</div>
         </body>
         </html>
+        """,
+        {"authors": ["John Doe"]},
+        id="author_prefix_cleanup",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["authors"] == ["John Doe"]
-
-    def test_extract_metadata_issue_information(self):
-        """Test extraction of issue number and season information."""
-        html_content = """
         <html>
         <body>
             <h1>Test Article</h1>
             <p>From No. 79 (Winter 2025) issue</p>
         </body>
         </html>
+        """,
+        {"issue_number": "79", "issue_season": "Winter 2025"},
+        id="issue_information",
+    ),
+    pytest.param(
         """
-
-        metadata = extract_metadata(html_content)
-
-        assert metadata["issue_number"] == "79"
-        assert metadata["issue_season"] == "Winter 2025"
-
-    def test_extract_metadata_whitespace_normalization(self):
-        """Test that multiple spaces in author names are normalized."""
-        html_content = """
         <html>
         <head>
             <script type="application/ld+json">
@@ -140,23 +128,30 @@ class TestExtractMetadata:
                 "headline": "Test",
                 "author": [{"name": "John    Multiple   Spaces"}]
             }
-            </script>     
+            </script>
         </head>
         </html>
-        """
-
-        metadata = extract_metadata(html_content)
+        """,
+        {"authors": ["John Multiple Spaces"]},
+        id="whitespace_normalization",
+    ),
+    pytest.param(
+        "<html><body></body></html>",
+        {"title": None, "publication": "The New Atlantis"},
+        id="empty_html",
+    ),
+]
 
-        assert metadata["authors"] == ["John Multiple Spaces"]
 
-    def test_extract_metadata_empty_html(self):
-        """Test behavior with minimal HTML content."""
-        html_content = "<html><body></body></html>"
+class TestExtractMetadata:
+    """Test cases for the extract_metadata function."""
 
+    @pytest.mark.parametrize("html_content,expected", HTML_CASES)
+    def test_extract_metadata(self, html_content, expected):
+        """Test that each HTML case yields the expected metadata fields."""
         metadata = extract_metadata(html_content)
 
-        assert metadata["publication"] == "The New Atlantis"
-        assert "title" not in metadata or not metadata["title"]
+        assert {key: metadata.get(key) for key in expected} == expected
 
 
 class TestFormatMarkdownHeader:
@@ -199,6 +194,33 @@ publication: The New Atlantis
 
         assert "periodical-edition: No. 79 (Winter 2025)" in result
 
+    def test_format_markdown_header_full_output_with_issue(self):
+        """Test exact output with multiple authors and a periodical edition."""
+        metadata = {
+            "title": "Test Article",
+            "authors": ["First Author", "Second Author"],
+            "publication": "The New Atlantis",
+            "issue_number": "79",
+            "issue_season": "Winter 2025",
+        }
+
+        result = format_markdown_header(metadata, "2025-06-19")
+
+        expected = """---
+title: Test Article
+author:
+  - First Author
+  - Second Author
+format: journal article
+creation-date: 2025-06-19
+publication: The New Atlantis
+periodical-edition: No. 79 (Winter 2025)
+---
+
+## Notes"""
+
+        assert result == expected
+
     def test_format_markdown_header_multiple_authors(self):
         """Test markdown header with multiple authors."""
         metadata = {
@@ -237,52 +259,282 @@ publication: The New Atlantis
         assert "  - Unknown Author" in result
         assert "publication: The New Atlantis" in result
 
+    def test_format_markdown_header_empty_values_use_defaults(self):
+        """Test that an empty title or author list falls back to the defaults."""
+        metadata = {"title": "", "authors": [], "publication": "example.com"}
+
+        result = format_markdown_header(metadata, "2025-06-19")
+
+        assert result == (
+            "---\n"
+            "title: Unknown Title\n"
+            "author:\n"
+            "  - Unknown Author\n"
+            "format: journal article\n"
+            "creation-date: 2025-06-19\n"
+            "publication: example.com\n"
+            "---\n"
+            "\n"
+            "## Notes"
+        )
+
 
 class TestFetchArticleContent:
     """Test cases for the fetch_article_content function."""
 
-    @patch("article_assistant.requests.get")
-    def test_fetch_article_content_success(self, mock_get):
+    def test_fetch_article_content_success(self, mock_http):
         """Test successful article content fetching."""
-        mock_response = Mock()
-        mock_response.text = "<html>Article content</html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_session = mock_http("<html>Article content</html>")
 
         result = fetch_article_content("https://example.com/article")
 
         assert result == "<html>Article content</html>"
-        mock_get.assert_called_once()
+        mock_session.get.assert_called_once()
+
+        # Check that separate connect and read timeouts are always passed
+        assert mock_session.get.call_args[1]["timeout"] == (5, 30)
+
+    def test_fetch_article_content_custom_session(self):
+        """Test that a caller-supplied session is used instead of the shared one."""
+        mock_session = Mock()
+        mock_response = mock_session.get.return_value
+        mock_response.iter_content.return_value = [b"<html>From session</html>"]
+        mock_response.encoding = "utf-8"
+
+        result = fetch_article_content("https://example.com/article", mock_session)
 
-        # Check that proper headers were set
-        call_args = mock_get.call_args
-        assert "User-Agent" in call_args[1]["headers"]
+        assert result == "<html>From session</html>"
+        mock_session.get.assert_called_once_with(
+            "https://example.com/article", timeout=(5, 30), stream=True
+        )
 
-    @patch("article_assistant.requests.get")
-    def test_fetch_article_content_request_error(self, mock_get):
+    @patch("article_assistant._SESSION")
+    def test_fetch_article_content_request_error(self, mock_session):
         """Test handling of request errors."""
         from requests import RequestException
 
-        mock_get.side_effect = RequestException("Network error")
+        mock_session.get.side_effect = RequestException("Network error")
 
         with pytest.raises(SystemExit) as exc_info:
             fetch_article_content("https://example.com/article")
 
         assert exc_info.value.code == 1
 
-    @patch("article_assistant.requests.get")
-    def test_fetch_article_content_http_error(self, mock_get):
+    @patch("article_assistant._SESSION")
+    def test_fetch_article_content_http_error(self, mock_session):
         """Test handling of HTTP errors."""
         from requests import RequestException
 
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = RequestException("HTTP 404")
-        mock_get.return_value = mock_response
+        mock_session.get.return_value = mock_response
 
         with pytest.raises(SystemExit) as exc_info:
             fetch_article_content("https://example.com/article")
 
         assert exc_info.value.code == 1
+        # The streamed response must be closed so its connection is reused
+        mock_response.close.assert_called_once()
+
+    @patch("article_assistant._SESSION")
+    def test_fetch_article_content_decodes_without_declared_encoding(
+        self, mock_session
+    ):
+        """Test that bodies without a declared encoding are decoded as UTF-8."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"<html>Caf", b"\xc3\xa9</html>"]
+        mock_response.encoding = None
+        mock_session.get.return_value = mock_response
+
+        result = fetch_article_content("https://example.com/article")
+
+        assert result == "<html>Caf\u00e9</html>"
+
+    @patch("article_assistant._SESSION")
+    def test_fetch_article_content_unknown_encoding(self, mock_session):
+        """Test that an unknown declared charset falls back to UTF-8."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = ["<html>Caf\u00e9</html>".encode()]
+        mock_response.encoding = "utf8mb4"
+        mock_session.get.return_value = mock_response
+
+        result = fetch_article_content("https://example.com/article")
+
+        assert result == "<html>Caf\u00e9</html>"
+
+    @patch("article_assistant._MAX_RESPONSE_BYTES", 10)
+    @patch("article_assistant._SESSION")
+    def test_fetch_article_content_too_large(self, mock_session, capsys):
+        """Test that responses over the size cap are rejected."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"x" * 8, b"x" * 8, b"x" * 8]
+        mock_session.get.return_value = mock_response
+
+        with pytest.raises(SystemExit) as exc_info:
+            fetch_article_content("https://example.com/article")
+
+        assert exc_info.value.code == 1
+        assert "exceeds" in capsys.readouterr().err
+        mock_response.close.assert_called_once()
+
+
+class TestGetSession:
+    """Test cases for the _get_session function."""
+
+    @patch.dict(sys.modules, {"requests_cache": None})
+    @patch("article_assistant._SESSION", None)
+    def test_get_session_without_requests_cache(self):
+        """Test that a plain shared session is used when requests-cache is absent."""
+        import requests
+
+        session = _get_session()
+
+        assert type(session) is requests.Session
+        assert "Mozilla" in session.headers["User-Agent"]
+        assert _get_session() is session
+
+    @patch.dict(sys.modules, {"requests_cache": None})
+    @patch("article_assistant._SESSION", None)
+    def test_get_session_pools_http_and_https(self):
+        """Test that both schemes share one adapter sized for fetch_many's workers."""
+        session = _get_session()
+
+        adapter = session.get_adapter("https://example.com")
+        assert session.get_adapter("http://example.com") is adapter
+        assert adapter._pool_maxsize >= 8
+
+    @patch("requests_cache.CachedSession")
+    @patch("article_assistant._SESSION", None)
+    def test_get_session_with_requests_cache(self, mock_cached_session, monkeypatch):
+        """Test that an on-disk cached session is used when requests-cache is installed."""
+        monkeypatch.delenv("ARTICLE_ASSISTANT_OFFLINE", raising=False)
+
+        session = _get_session()
+
+        assert session is mock_cached_session.return_value
+        mock_cached_session.assert_called_once_with(
+            "article-assistant",
+            use_cache_dir=True,
+            expire_after=86400,
+            cache_control=True,
+            only_if_cached=False,
+            stale_if_error=False,
+            filter_fn=_read_before_caching,
+        )
+        session.headers.update.assert_called_once()
+
+    @patch("requests_cache.CachedSession")
+    def test_new_session_offline_is_cache_only(self, mock_cached_session, monkeypatch):
+        """Test that ARTICLE_ASSISTANT_OFFLINE=1 serves only from the cache."""
+        monkeypatch.setenv("ARTICLE_ASSISTANT_OFFLINE", "1")
+
+        session = _new_session(use_cache=False)
+
+        assert session is mock_cached_session.return_value
+        assert mock_cached_session.call_args[1]["only_if_cached"] is True
+        assert mock_cached_session.call_args[1]["stale_if_error"] is True
+
+    @patch.dict(sys.modules, {"requests_cache": None})
+    def test_new_session_offline_requires_requests_cache(self, monkeypatch):
+        """Test that offline mode without requests-cache is a clear error."""
+        monkeypatch.setenv("ARTICLE_ASSISTANT_OFFLINE", "1")
+
+        with pytest.raises(RuntimeError, match="requires the requests-cache package"):
+            _new_session()
+
+    @patch("requests_cache.CachedSession")
+    def test_new_session_without_cache(self, mock_cached_session):
+        """Test that use_cache=False builds a plain session even with requests-cache."""
+        import requests
+
+        session = _new_session(use_cache=False)
+
+        assert type(session) is requests.Session
+        mock_cached_session.assert_not_called()
+
+
+class TestCachedFetch:
+    """Test fetching through a real requests-cache session."""
+
+    @pytest.fixture
+    def cached_session(self, tmp_path, monkeypatch):
+        """A real CachedSession stored under tmp_path."""
+        pytest.importorskip("requests_cache")
+        monkeypatch.setattr("article_assistant._CACHE_NAME", str(tmp_path / "cache"))
+        monkeypatch.delenv("ARTICLE_ASSISTANT_OFFLINE", raising=False)
+        session = _new_session()
+        yield session
+        session.close()
+
+    def test_cached_fetch_stores_page_within_limit(self, cached_session, local_server):
+        """Test that a page under the cap is returned and served from the cache."""
+        base_url = local_server({"/small": b"<html>Small page</html>"})
+
+        first = fetch_article_content(f"{base_url}/small", cached_session)
+        second = cached_session.get(f"{base_url}/small")
+
+        assert first == "<html>Small page</html>"
+        assert second.from_cache
+        assert second.text == "<html>Small page</html>"
+
+    @patch("article_assistant._MAX_RESPONSE_BYTES", 1024)
+    def test_cached_fetch_never_stores_oversized_page(
+        self, cached_session, local_server, capsys
+    ):
+        """Test that an oversized page is rejected before it is written to the cache."""
+        base_url = local_server({"/big": b"x" * 4096})
+
+        with pytest.raises(SystemExit) as exc_info:
+            fetch_article_content(f"{base_url}/big", cached_session)
+
+        assert exc_info.value.code == 1
+        assert "exceeds" in capsys.readouterr().err
+        assert len(cached_session.cache.responses) == 0
+
+
+class TestFetchMany:
+    """Test cases for the fetch_many function."""
+
+    def test_fetch_many_preserves_order(self, mock_http):
+        """Test that results come back in the same order as the input URLs."""
+        mock_session = mock_http(lambda url: f"<html>{url}</html>")
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        result = fetch_many(urls, max_workers=3)
+
+        assert result == [f"<html>{url}</html>" for url in urls]
+        assert mock_session.get.call_count == 5
+
+    @patch("article_assistant._SESSION")
+    def test_fetch_many_propagates_fetch_error(self, mock_session):
+        """Test that a failed fetch still exits with status 1."""
+        from requests import RequestException
+
+        mock_session.get.side_effect = RequestException("Network error")
+
+        with pytest.raises(SystemExit) as exc_info:
+            fetch_many(["https://example.com/a", "https://example.com/b"])
+
+        assert exc_info.value.code == 1
+
+    def test_fetch_many_return_exceptions(self, mock_http):
+        """Test that return_exceptions keeps good pages and returns the errors."""
+        from requests import HTTPError
+
+        mock_http(
+            {
+                "https://example.com/good": "<html>ok</html>",
+                "https://example.com/bad": HTTPError("404 Not Found"),
+            }
+        )
+
+        result = fetch_many(
+            ["https://example.com/good", "https://example.com/bad"],
+            return_exceptions=True,
+        )
+
+        assert result[0] == "<html>ok</html>"
+        assert isinstance(result[1], HTTPError)
 
 
 class TestInferEditionNumber:
@@ -352,6 +604,12 @@ class TestInferEditionNumber:
         result = infer_edition_number("Winter", "2025")
         assert result == 79
 
+    def test_infer_edition_number_outside_table_range(self):
+        """Test that years outside the precomputed table are still calculated."""
+        assert infer_edition_number("Winter", 1999) == -25
+        assert infer_edition_number("Fall", 2100) == 382
+        assert infer_edition_number("Invalid", 2100) is None
+
     def test_extract_metadata_season_only_winter_2025(self):
         """Test extracting season-only information and inferring edition number."""
         html_content = """
@@ -418,6 +676,74 @@ class TestInferEditionNumber:
         assert metadata["issue_number"] == "79"
         assert metadata["issue_season"] == "Winter 2025"
 
+    def test_extract_metadata_explicit_issue_after_season(self):
+        """Test that an explicit issue number wins even when a season appears first."""
+        html_content = """
+        <html>
+        <body>
+            <h1>Test Article</h1>
+            <p>Also mentions Spring 2024</p>
+            <p>From No. 79 (Winter 2025) issue</p>
+        </body>
+        </html>
+        """
+
+        metadata = extract_metadata(html_content)
+
+        assert metadata["issue_number"] == "79"
+        assert metadata["issue_season"] == "Winter 2025"
+
+    def test_extract_metadata_issue_season_inside_link(self):
+        """Test that markup inside the issue parentheses is not captured."""
+        html_content = '<p>No. 5 (<a href="/x">Winter 2025</a>)</p>'
+
+        metadata = extract_metadata(html_content)
+
+        assert metadata["issue_number"] == "5"
+        assert metadata["issue_season"] == "Winter 2025"
+
+    def test_extract_metadata_ignores_seasons_in_attributes(self):
+        """Test that attribute values such as image alt text are not scanned."""
+        html_content = """
+        <html>
+        <body>
+            <img src="/cover.jpg" alt="Summer 2020 cover">
+            <p>Published in Winter 2025</p>
+        </body>
+        </html>
+        """
+
+        metadata = extract_metadata(html_content)
+
+        assert metadata["issue_number"] == "79"
+        assert metadata["issue_season"] == "Winter 2025"
+
+    def test_extract_metadata_bare_less_than_in_text(self):
+        """Test that a bare "<" followed by an apostrophe does not hide the issue."""
+        html_content = (
+            "<p>3 < 4 isn't it</p><p>From No. 79 (Winter 2025)</p><p>it's fine</p>"
+        )
+
+        metadata = extract_metadata(html_content)
+
+        assert metadata["issue_number"] == "79"
+        assert metadata["issue_season"] == "Winter 2025"
+
+    @pytest.mark.parametrize(
+        "html_content",
+        [
+            "<p>No.&nbsp;79 (Winter&nbsp;2025)</p>",
+            "<p>No.&#160;79 (Winter&#160;2025)</p>",
+            "<p>Published in Winter&nbsp;2025</p>",
+        ],
+    )
+    def test_extract_metadata_issue_with_non_breaking_spaces(self, html_content):
+        """Test that &nbsp; entities count as whitespace in issue information."""
+        metadata = extract_metadata(html_content)
+
+        assert metadata["issue_number"] == "79"
+        assert metadata["issue_season"] == "Winter 2025"
+
     def test_format_markdown_header_with_inferred_edition(self):
         """Test that markdown header works with inferred edition numbers."""
         metadata = {
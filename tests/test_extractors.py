@@ -49,6 +49,209 @@ class TestNewAtlantisExtractor:
         assert metadata["authors"] == ["Author Name"]
         assert metadata["publication"] == "The New Atlantis"
 
+    @patch("bs4.BeautifulSoup")
+    def test_extract_metadata_json_ld_skips_html_parse(self, mock_soup):
+        """Test that complete JSON-LD metadata never builds a BeautifulSoup tree."""
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <script type='application/ld+json'>
+            {
+                "@type": "Article",
+                "headline": "Test Article",
+                "author": [{"name": "Author Name"}],
+                "datePublished": "2025-01-15"
+            }
+            </script>
+        </head>
+        <body><p>No. 79 (Winter 2025)</p></body>
+        </html>
+        """
+
+        metadata = extractor.extract_metadata(html, "https://thenewatlantis.com/test")
+
+        mock_soup.assert_not_called()
+        assert metadata["title"] == "Test Article"
+        assert metadata["authors"] == ["Author Name"]
+        assert metadata["date_published"] == "2025-01-15"
+        assert metadata["issue_number"] == "79"
+
+    def test_extract_metadata_unquoted_json_ld_type(self):
+        """Test that a minified JSON-LD block with an unquoted type is parsed."""
+        extractor = NewAtlantisExtractor()
+
+        html = (
+            "<html><head><script type=application/ld+json>"
+            '{"@type":"Article","headline":"Minified Title",'
+            '"author":[{"name":"Jane Smith"}],"datePublished":"2025-01-15"}'
+            "</script></head><body><h1>Heading Title</h1></body></html>"
+        )
+
+        metadata = extractor.extract_metadata(html, "https://thenewatlantis.com/test")
+
+        assert metadata["title"] == "Minified Title"
+        assert metadata["authors"] == ["Jane Smith"]
+        assert metadata["date_published"] == "2025-01-15"
+
+    def test_extract_metadata_uses_first_article_json_ld(self):
+        """Test that non-Article blocks are skipped and the first Article wins."""
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {"@type": "Organization", "name": "The New Atlantis"}
+            </script>
+            <script type="application/ld+json">
+            {"@type": "Article", "headline": "First", "author": {"name": "A"}}
+            </script>
+            <script type="application/ld+json">
+            {"@type": "Article", "headline": "Second", "author": {"name": "B"}}
+            </script>
+        </head>
+        </html>
+        """
+
+        metadata = extractor.extract_metadata(html, "https://thenewatlantis.com/test")
+
+        assert metadata["title"] == "First"
+        assert metadata["authors"] == ["A"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extract_metadata_json_ld_with_and_without_orjson(self, use_orjson):
+        """Test that JSON-LD parses the same with orjson and with stdlib json."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <script type="application/ld+json">
+        {"@type": "Article", "headline": "Caf\\u00e9 Society",
+         "author": {"name": "José  Ortega"}}
+        </script>
+        """
+
+        with patch("article_assistant.orjson", orjson):
+            metadata = extractor.extract_metadata(
+                html, "https://thenewatlantis.com/test"
+            )
+
+        assert metadata["title"] == "Café Society"
+        assert metadata["authors"] == ["José Ortega"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extract_metadata_malformed_json_ld_falls_back_to_html(self, use_orjson):
+        """Test that malformed JSON-LD is skipped with either JSON parser."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">{"@type": "Article", </script>
+        </head>
+        <body>
+            <h1>Heading Title</h1>
+            <div class="byline">By Jane Smith</div>
+        </body>
+        </html>
+        """
+
+        with patch("article_assistant.orjson", orjson):
+            metadata = extractor.extract_metadata(
+                html, "https://thenewatlantis.com/test"
+            )
+
+        assert metadata["title"] == "Heading Title"
+        assert metadata["authors"] == ["Jane Smith"]
+
+    def test_extract_metadata_json_ld_without_authors_uses_byline(self):
+        """Test that the HTML byline fills in authors missing from JSON-LD."""
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {"@type": "Article", "headline": "JSON-LD Title"}
+            </script>
+        </head>
+        <body>
+            <h1>Heading Title</h1>
+            <div class="byline">By Jane Smith</div>
+        </body>
+        </html>
+        """
+
+        metadata = extractor.extract_metadata(html, "https://thenewatlantis.com/test")
+
+        assert metadata["title"] == "JSON-LD Title"
+        assert metadata["authors"] == ["Jane Smith"]
+
+    def test_extract_metadata_byline_fallback_parses_only_byline(self):
+        """Test that a missing author builds only byline elements, not the body."""
+        from bs4 import BeautifulSoup
+
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {"@type": "Article", "headline": "JSON-LD Title"}
+            </script>
+        </head>
+        <body>
+            <h1>Heading Title</h1>
+            <p>Long article body.</p>
+            <span class="post-author-name">By  Jane   Smith</span>
+        </body>
+        </html>
+        """
+
+        soups = []
+
+        def build_soup(*args, **kwargs):
+            soups.append(BeautifulSoup(*args, **kwargs))
+            return soups[-1]
+
+        with patch("bs4.BeautifulSoup", side_effect=build_soup):
+            metadata = extractor.extract_metadata(
+                html, "https://thenewatlantis.com/test"
+            )
+
+        assert len(soups) == 1
+        assert soups[0].find("p") is None
+        assert soups[0].find("h1") is None
+        assert metadata["title"] == "JSON-LD Title"
+        assert metadata["authors"] == ["Jane Smith"]
+
+    def test_extract_metadata_json_ld_without_headline_uses_h1(self):
+        """Test that the HTML h1 fills in a title missing from JSON-LD."""
+        extractor = NewAtlantisExtractor()
+
+        html = """
+        <html>
+        <head>
+            <title>Page Title</title>
+            <script type="application/ld+json">
+            {"@type": "Article", "author": [{"name": "Jane Smith"}]}
+            </script>
+        </head>
+        <body>
+            <div class="byline">By Someone Else</div>
+            <h1>Heading Title</h1>
+        </body>
+        </html>
+        """
+
+        metadata = extractor.extract_metadata(html, "https://thenewatlantis.com/test")
+
+        assert metadata["title"] == "Heading Title"
+        assert metadata["authors"] == ["Jane Smith"]
+
     def test_extract_metadata_with_issue_inference(self):
         """Test that edition number inference works."""
         extractor = NewAtlantisExtractor()
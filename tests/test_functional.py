@@ -4,67 +4,152 @@ Functional tests for article_assistant.py
 Tests the script end-to-end with real and mock data.
 """
 
-import subprocess
+import io
 import sys
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, Mock
 import pytest
+from requests import RequestException
+from urllib3 import HTTPResponse
 
-from article_assistant import main
+from article_assistant import (
+    ArticleMetadata,
+    _read_batch_urls,
+    extract_metadata,
+    format_markdown_header,
+    main,
+)
+
+
+def run_cli(argv):
+    """Run main() in-process with the given argv and return its exit code."""
+    with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc_info:
+        main()
+    return exc_info.value.code
+
+
+def titled_page(url):
+    """Return a minimal page whose <h1> names the last three characters of url."""
+    return f"<html><body><h1>Title {url[-3:]}</h1></body></html>"
+
+
+def seed_cache(cache_name, url, body, expires=None):
+    """Store a 200 response for url in the requests-cache database at cache_name."""
+    requests = pytest.importorskip("requests")
+    requests_cache = pytest.importorskip("requests_cache")
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = body
+    response.raw = HTTPResponse(status=200, request_url=url)
+    response.request = requests.Request("GET", url).prepare()
+    seed = requests_cache.CachedSession(cache_name, use_cache_dir=True)
+    seed.cache.save_response(response, expires=expires)
+    seed.close()
 
 
 class TestFunctionalEndToEnd:
     """Functional tests for the complete script execution."""
 
-    def test_script_network_error(self):
+    @patch("article_assistant._SESSION")
+    def test_script_network_error(self, mock_session, capsys):
         """Test script behavior when network request fails."""
-        result = subprocess.run(
+        mock_session.get.side_effect = RequestException("Name or service not known")
+
+        code = run_cli(
             [
-                sys.executable,
                 "article_assistant.py",
                 "metadata",
                 "https://nonexistent-domain-12345.com/article",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
+            ]
+        )
+
+        assert code == 1
+        assert "Error fetching article:" in capsys.readouterr().err
+
+    @patch("article_assistant._SESSION", None)
+    def test_script_offline_serves_cached_page(self, tmp_path, monkeypatch, capsys):
+        """Test that offline mode answers from the cache and never hits the network."""
+        cache_name = str(tmp_path / "http-cache")
+        monkeypatch.setattr("article_assistant._CACHE_NAME", cache_name)
+        monkeypatch.setenv("ARTICLE_ASSISTANT_OFFLINE", "1")
+
+        # Seed the cache so the first fetch can be answered without the network
+        url = "https://www.thenewatlantis.com/cached"
+        seed_cache(cache_name, url, b"<html><body><h1>Cached Title</h1></body></html>")
+
+        with patch.object(sys, "argv", ["article_assistant.py", "metadata", url]):
+            main()
+        assert "title: Cached Title" in capsys.readouterr().out
+
+        code = run_cli(
+            ["article_assistant.py", "metadata", "https://www.thenewatlantis.com/miss"]
+        )
+        assert code == 1
+        assert "Error fetching article:" in capsys.readouterr().err
+
+    @patch("article_assistant._SESSION", None)
+    def test_script_offline_serves_expired_page(self, tmp_path, monkeypatch, capsys):
+        """Test that offline mode still serves an entry past its cache expiry."""
+        cache_name = str(tmp_path / "http-cache")
+        monkeypatch.setattr("article_assistant._CACHE_NAME", cache_name)
+        monkeypatch.setenv("ARTICLE_ASSISTANT_OFFLINE", "1")
+
+        url = "https://www.thenewatlantis.com/old"
+        seed_cache(
+            cache_name,
+            url,
+            b"<html><body><h1>Old Title</h1></body></html>",
+            expires=datetime.now(timezone.utc) - timedelta(days=2),
+        )
+
+        with patch.object(sys, "argv", ["article_assistant.py", "metadata", url]):
+            main()
+        assert "title: Old Title" in capsys.readouterr().out
+
+    @patch("article_assistant._new_session")
+    def test_script_offline_rejects_no_cache(
+        self, mock_new_session, monkeypatch, capsys
+    ):
+        """Test that --no-cache with offline mode is an error, not silently ignored."""
+        monkeypatch.setenv("ARTICLE_ASSISTANT_OFFLINE", "1")
+
+        code = run_cli(
+            [
+                "article_assistant.py",
+                "metadata",
+                "--no-cache",
+                "https://www.thenewatlantis.com/test",
+            ]
         )
 
-        assert result.returncode == 1
-        assert "Error fetching article:" in result.stderr
+        assert code == 1
+        assert "--no-cache cannot be used" in capsys.readouterr().err
+        mock_new_session.assert_not_called()
 
     def test_script_no_arguments(self):
         """Test script behavior when no subcommand provided."""
-        result = subprocess.run(
-            [sys.executable, "article_assistant.py"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        )
+        code = run_cli(["article_assistant.py"])
 
-        assert result.returncode == 2  # argparse error
+        assert code == 2  # argparse error
 
-    def test_script_help_message(self):
+    def test_script_help_message(self, capsys):
         """Test script help message display."""
-        result = subprocess.run(
-            [sys.executable, "article_assistant.py", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent,
-        )
+        code = run_cli(["article_assistant.py", "--help"])
 
-        assert result.returncode == 0
-        assert "metadata" in result.stdout
-        assert "content" in result.stdout
+        assert code == 0
+        out = capsys.readouterr().out
+        assert "metadata" in out
+        assert "content" in out
 
 
 class TestFunctionalIntegration:
     """Integration tests using the main function directly."""
 
-    @patch("article_assistant.requests.get")
-    @patch("builtins.print")
     @patch("sys.argv", ["script.py", "metadata", "https://www.thenewatlantis.com/test"])
-    def test_main_function_integration(self, mock_print, mock_get):
+    def test_main_function_integration(self, mock_http, capsys):
         """Test main function integration with mocked dependencies."""
         mock_html = """
         <html>
@@ -80,27 +165,21 @@ class TestFunctionalIntegration:
         </html>
         """
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_http(mock_html)
 
         main()
 
-        # Verify print was called with the formatted output
-        mock_print.assert_called_once()
-        output = mock_print.call_args[0][0]
+        output = capsys.readouterr().out
 
         assert "title: Integration Test" in output
         assert "  - Integration Author" in output
         assert "## Notes" in output
 
-    @patch("article_assistant.requests.get")
     @patch(
         "sys.argv",
         ["script.py", "metadata", "--creation-date", "2023-05-01", "https://test.com"],
     )
-    def test_main_function_with_custom_date(self, mock_get, capsys):
+    def test_main_function_with_custom_date(self, mock_http, capsys):
         """Test main function with custom creation date."""
         mock_html = """
         <html>
@@ -108,31 +187,142 @@ class TestFunctionalIntegration:
         </html>
         """
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_http(mock_html)
 
         main()
 
         captured = capsys.readouterr()
         assert "creation-date: 2023-05-01" in captured.out
 
+    @patch(
+        "sys.argv",
+        [
+            "script.py",
+            "metadata",
+            "--creation-date",
+            "2023-05-01",
+            "https://www.thenewatlantis.com/one",
+            "https://www.thenewatlantis.com/two",
+        ],
+    )
+    def test_main_function_multiple_urls(self, mock_http, capsys):
+        """Test that several URLs produce one header each, in argument order."""
+        mock_http(titled_page)
+
+        main()
+
+        captured = capsys.readouterr()
+        assert captured.out.count("## Notes") == 2
+        assert captured.out.index("title: Title one") < captured.out.index(
+            "title: Title two"
+        )
+
+    @patch("article_assistant._PARALLEL_PARSE_MIN", 2)
+    def test_main_function_batch_file(self, mock_http, tmp_path, capsys):
+        """Test --batch URLs are parsed in worker processes and printed in order."""
+        batch_file = tmp_path / "urls.txt"
+        batch_file.write_text(
+            "# reading list\n"
+            "https://www.thenewatlantis.com/one\n"
+            "\n"
+            "https://www.thenewatlantis.com/two\n"
+        )
+        mock_http(titled_page)
+
+        with patch(
+            "sys.argv",
+            [
+                "script.py",
+                "metadata",
+                "https://www.thenewatlantis.com/six",
+                "--batch",
+                str(batch_file),
+            ],
+        ):
+            main()
+
+        out = capsys.readouterr().out
+        assert out.count("## Notes") == 3
+        assert (
+            out.index("title: Title six")
+            < out.index("title: Title one")
+            < out.index("title: Title two")
+        )
+
+    @patch("article_assistant._new_session")
+    @patch("article_assistant._SESSION")
+    @patch(
+        "sys.argv",
+        ["script.py", "metadata", "--no-cache", "https://www.thenewatlantis.com/one"],
+    )
+    def test_main_function_no_cache(self, mock_session, mock_new_session, capsys):
+        """Test that --no-cache fetches with an uncached session instead of _SESSION."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [
+            b"<html><body><h1>Fresh Title</h1></body></html>"
+        ]
+        mock_response.encoding = "utf-8"
+        mock_new_session.return_value.get.return_value = mock_response
+
+        main()
+
+        mock_new_session.assert_called_once_with(use_cache=False)
+        mock_session.get.assert_not_called()
+        assert "title: Fresh Title" in capsys.readouterr().out
+
+    def test_main_function_batch_with_failed_url(self, mock_http, tmp_path, capsys):
+        """Test that a failed URL is reported while the other headers still print."""
+        batch_file = tmp_path / "urls.txt"
+        batch_file.write_text(
+            "https://www.thenewatlantis.com/one\nhttps://www.thenewatlantis.com/gone\n"
+        )
+        mock_http(
+            {
+                "https://www.thenewatlantis.com/one": titled_page(
+                    "https://www.thenewatlantis.com/one"
+                ),
+                "https://www.thenewatlantis.com/gone": RequestException(
+                    "404 Client Error: Not Found"
+                ),
+            }
+        )
+
+        code = run_cli(["script.py", "metadata", "--batch", str(batch_file)])
+
+        captured = capsys.readouterr()
+        assert code == 1
+        assert captured.out.count("## Notes") == 1
+        assert "title: Title one" in captured.out
+        assert (
+            "Error fetching article: https://www.thenewatlantis.com/gone: 404"
+            in captured.err
+        )
+
+    @patch(
+        "sys.stdin",
+        io.StringIO("https://a.example/1\n  \n# skip\nhttps://b.example/2\n"),
+    )
+    def test_read_batch_urls_from_stdin(self):
+        """Test reading --batch URLs from stdin, skipping blanks and comments."""
+        assert _read_batch_urls("-") == ["https://a.example/1", "https://b.example/2"]
+
+    @patch("sys.argv", ["script.py", "metadata"])
+    def test_main_function_metadata_requires_url(self):
+        """Test that metadata without URLs or --batch is an argument error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+
     @patch("article_assistant.llm")
-    @patch("article_assistant.requests.get")
     @patch("sys.argv", ["script.py", "metadata", "https://example.com/article"])
-    def test_main_function_url_validation_warning(self, mock_get, mock_llm, capsys):
+    def test_main_function_url_validation_warning(self, mock_llm, mock_http, capsys):
         """Test main function with generic site (LLM-based extraction)."""
         mock_html = "<html><body><h1>Test</h1></body></html>"
 
-        mock_response = Mock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_http(mock_html)
 
         # Mock LLM to avoid actual API calls
-        from article_assistant import ArticleMetadata
-
         mock_metadata = ArticleMetadata(
             title="Test Article", authors=["Test Author"], publication="Example.com"
         )
@@ -153,8 +343,6 @@ class TestFunctionalRealWorldHtml:
 
     def test_complex_html_structure(self):
         """Test with complex HTML structure similar to real articles."""
-        from article_assistant import extract_metadata, format_markdown_header
-
         complex_html = """
         <!DOCTYPE html>
         <html lang="en">
@@ -215,8 +403,6 @@ class TestFunctionalRealWorldHtml:
 
     def test_fallback_html_parsing(self):
         """Test fallback HTML parsing when JSON-LD is malformed."""
-        from article_assistant import extract_metadata
-
         fallback_html = """
         <html>
         <head>
@@ -250,8 +436,6 @@ class TestFunctionalRealWorldHtml:
 
     def test_minimal_html_handling(self):
         """Test handling of minimal HTML with missing elements."""
-        from article_assistant import extract_metadata, format_markdown_header
-
         minimal_html = """
         <html>
         <head><title>Minimal Article</title></head>